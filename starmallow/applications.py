@@ -29,7 +29,6 @@ from starlette.responses import HTMLResponse, Response
 from starlette.routing import BaseRoute
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from starmallow.datastructures import Default
 from starmallow.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
 from starmallow.endpoints import APIHTTPEndpoint
 from starmallow.exception_handlers import (
@@ -39,10 +38,16 @@ from starmallow.exception_handlers import (
 from starmallow.exceptions import RequestValidationError, SchemaGenerationError
 from starmallow.middleware import AsyncExitStackMiddleware
 from starmallow.responses import JSONResponse
-from starmallow.routing import APIRoute, APIRouter
+from starmallow.routing import (
+    _DEFAULT_GENERATE_UNIQUE_ID,
+    _DEFAULT_REQUEST_CLASS,
+    _DEFAULT_RESPONSE_CLASS,
+    APIRoute,
+    APIRouter,
+    _make_verb_decorator,
+)
 from starmallow.schema_generator import SchemaGenerator
 from starmallow.types import DecoratedCallable
-from starmallow.utils import generate_unique_id
 
 logger = getLogger(__name__)
 
@@ -252,7 +257,8 @@ class StarMallow(Starlette):
         include_in_schema: bool = True,
         status_code: Optional[int] = None,
         middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
+        deprecated: Optional[bool] = None,
+        request_class: Type[Request] = _DEFAULT_REQUEST_CLASS,
         response_model: Optional[Type[Any]] = None,
         response_class: Type[Response] = JSONResponse,
         # OpenAPI summary
@@ -264,11 +270,12 @@ class StarMallow(Starlette):
         # Sets the OpenAPI operationId to be used in your path operation
         operation_id: Optional[str] = None,
         # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
+        generate_unique_id_function: Callable[["APIRoute"], str] = _DEFAULT_GENERATE_UNIQUE_ID,
         # OpenAPI tags
         tags: Optional[List[Union[str, Enum]]] = None,
         # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
         openapi_extra: Optional[Dict[str, Any]] = None,
+        route_class: Optional[Type[APIRoute]] = None,
     ) -> None:
         return self.router.add_api_route(
             path=path,
@@ -278,6 +285,7 @@ class StarMallow(Starlette):
             include_in_schema=include_in_schema,
             status_code=status_code,
             middleware=middleware,
+            deprecated=deprecated,
             request_class=request_class,
             response_model=response_model,
             response_class=response_class,
@@ -290,6 +298,7 @@ class StarMallow(Starlette):
             generate_unique_id_function=generate_unique_id_function,
             openapi_extra=openapi_extra,
             tags=tags,
+            route_class=route_class,
         )
 
     def api_route(
@@ -301,7 +310,8 @@ class StarMallow(Starlette):
         include_in_schema: bool = True,
         status_code: Optional[int] = None,
         middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
+        deprecated: Optional[bool] = None,
+        request_class: Type[Request] = _DEFAULT_REQUEST_CLASS,
         response_model: Optional[Type[Any]] = None,
         response_class: Type[Response] = JSONResponse,
         # OpenAPI summary
@@ -313,11 +323,12 @@ class StarMallow(Starlette):
         # Sets the OpenAPI operationId to be used in your path operation
         operation_id: Optional[str] = None,
         # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
+        generate_unique_id_function: Callable[["APIRoute"], str] = _DEFAULT_GENERATE_UNIQUE_ID,
         # OpenAPI tags
         tags: Optional[List[Union[str, Enum]]] = None,
         # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
         openapi_extra: Optional[Dict[str, Any]] = None,
+        route_class: Optional[Type[APIRoute]] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         return self.router.api_route(
             path=path,
@@ -326,6 +337,7 @@ class StarMallow(Starlette):
             include_in_schema=include_in_schema,
             status_code=status_code,
             middleware=middleware,
+            deprecated=deprecated,
             request_class=request_class,
             response_model=response_model,
             response_class=response_class,
@@ -338,6 +350,7 @@ class StarMallow(Starlette):
             generate_unique_id_function=generate_unique_id_function,
             openapi_extra=openapi_extra,
             tags=tags,
+            route_class=route_class,
         )
 
     def add_api_websocket_route(
@@ -364,11 +377,9 @@ class StarMallow(Starlette):
         callbacks: Optional[List[BaseRoute]] = None,
         deprecated: Optional[bool] = None,
         include_in_schema: bool = True,
-        default_request_class: Type[Request] = Default(Request),
-        default_response_class: Type[Response] = Default(JSONResponse),
-        generate_unique_id_function: Callable[[APIRoute], str] = Default(
-            generate_unique_id,
-        ),
+        default_request_class: Type[Request] = _DEFAULT_REQUEST_CLASS,
+        default_response_class: Type[Response] = _DEFAULT_RESPONSE_CLASS,
+        generate_unique_id_function: Callable[[APIRoute], str] = _DEFAULT_GENERATE_UNIQUE_ID,
     ) -> None:
         self.router.include_router(
             router,
@@ -383,373 +394,14 @@ class StarMallow(Starlette):
             generate_unique_id_function=generate_unique_id_function,
         )
 
-    def get(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-    ):
-        return self.router.get(
-            path,
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-        )
-
-    def put(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-    ):
-        return self.router.put(
-            path,
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-        )
-
-    def post(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-    ):
-        return self.router.post(
-            path,
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-        )
-
-    def delete(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-    ):
-        return self.router.delete(
-            path,
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-        )
-
-    def options(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-    ):
-        return self.router.options(
-            path,
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-        )
-
-    def head(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-    ):
-        return self.router.head(
-            path,
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-        )
-
-    def patch(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-    ):
-        return self.router.patch(
-            path,
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-        )
-
-    def trace(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-    ):
-        return self.router.trace(
-            path,
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-        )
+    get = _make_verb_decorator('GET')
+    put = _make_verb_decorator('PUT')
+    post = _make_verb_decorator('POST')
+    delete = _make_verb_decorator('DELETE')
+    options = _make_verb_decorator('OPTIONS')
+    head = _make_verb_decorator('HEAD')
+    patch = _make_verb_decorator('PATCH')
+    trace = _make_verb_decorator('TRACE')
 
     def websocket_route(
         self, path: str, name: Union[str, None] = None,
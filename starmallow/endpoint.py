@@ -1,3 +1,4 @@
+import functools
 import inspect
 import logging
 from dataclasses import dataclass, field
@@ -11,6 +12,7 @@ from typing import (
     Mapping,
     NewType,
     Optional,
+    Tuple,
     Type,
     Union,
     get_args,
@@ -116,6 +118,25 @@ class EndpointModel:
     def security_params(self) -> Dict[str, Security] | None:
         return self.flat_params.get(ParamType.security)
 
+    @functools.cached_property
+    def schema_params(self) -> List[Tuple[str, str, Query | Path | Header | Cookie]]:
+        '''
+            (location, name, param) of the query, path, header and cookie params that are included in the
+            OpenAPI schema, in that order.
+        '''
+        return [
+            (location, name, param)
+            for location, params in (
+                ('query', self.query_params),
+                ('path', self.path_params),
+                ('header', self.header_params),
+                ('cookie', self.cookie_params),
+            )
+            if params
+            for name, param in params.items()
+            if param.include_in_schema
+        ]
+
 
 class SchemaMeta:
     def __init__(self, title):
@@ -3,22 +3,10 @@ import functools
 import inspect
 import logging
 from enum import Enum, IntEnum
-from typing import (
-    Any,
-    Awaitable,
-    Callable,
-    Coroutine,
-    Dict,
-    List,
-    Optional,
-    Sequence,
-    Set,
-    Tuple,
-    Type,
-    Union,
-)
+from typing import Any, Awaitable, Callable, Coroutine, Protocol, Sequence, cast
 
 import marshmallow as ma
+import marshmallow.fields as mf
 from starlette import routing
 from starlette.concurrency import run_in_threadpool
 from starlette.middleware import Middleware
@@ -58,10 +46,25 @@ from starmallow.websockets import APIWebSocket
 
 logger = logging.getLogger(__name__)
 
+# Shared default sentinels, so the signatures below don't each allocate their own.
+_DEFAULT_REQUEST_CLASS = Default(Request)
+_DEFAULT_RESPONSE_CLASS = Default(JSONResponse)
+_DEFAULT_GENERATE_UNIQUE_ID = Default(generate_unique_id)
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_description(doc: str | None) -> str:
+    """
+    Cleans up the endpoint docstring for use as the OpenAPI description.
+
+    Cached, as the same function is often registered directly as several routes, e.g. one per path or method set.
+    """
+    return inspect.cleandoc(doc or "").split("\f", 1)[0]
+
 
 async def run_endpoint_function(
     endpoint_model: EndpointModel,
-    values: Dict[str, Any],
+    values: dict[str, Any],
 ) -> Any:
     assert endpoint_model.call is not None, "endpoint_model.call must be a function"
 
@@ -78,8 +81,8 @@ async def run_endpoint_function(
 
 
 def request_response(
-    func: Callable[[Request], Union[Awaitable[Response], Response]],
-    request_class: Type[Request],
+    func: Callable[[Request], Awaitable[Response] | Response],
+    request_class: type[Request],
 ) -> ASGIApp:
     """
     Takes a function or coroutine `func(request) -> response`,
@@ -139,7 +142,7 @@ def get_request_handler(
         elif is_marshmallow_field(endpoint_model.response_model):
             response_data = endpoint_model.response_model._serialize(raw_response, attr='response', obj=raw_response)
 
-        response_args: Dict[str, Any] = {"background": background_tasks}
+        response_args: dict[str, Any] = {"background": background_tasks}
         if endpoint_model.status_code is not None:
             response_args["status_code"] = endpoint_model.status_code
         if sub_response.status_code:
@@ -148,7 +151,8 @@ def get_request_handler(
         response = endpoint_model.response_class(response_data, **response_args)
         if not is_body_allowed_for_status_code(response.status_code):
             response.body = b""
-        response.headers.raw.extend(sub_response.headers.raw)
+        if sub_response.headers.raw:
+            response.headers.raw.extend(sub_response.headers.raw)
 
         return response
 
@@ -181,7 +185,7 @@ class APIWebSocketRoute(routing.WebSocketRoute, EndpointMixin):
         path: str,
         endpoint: Callable[..., Any],
         *,
-        name: Optional[str] = None,
+        name: str | None = None,
     ) -> None:
         self.path = path
         self.endpoint = endpoint
@@ -198,7 +202,7 @@ class APIWebSocketRoute(routing.WebSocketRoute, EndpointMixin):
             ),
         )
 
-    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
         match, child_scope = super().matches(scope)
         if match != Match.NONE:
             child_scope["route"] = self
@@ -212,35 +216,29 @@ class APIRoute(routing.Route, EndpointMixin):
         path: str,
         endpoint: Callable[..., Any],
         *,
-        name: Optional[str] = None,
-        methods: Optional[Union[Set[str], List[str]]] = None,
+        name: str | None = None,
+        methods: set[str] | frozenset[str] | list[str] | None = None,
         include_in_schema: bool = True,
-        middleware: Sequence[Middleware] | None = None,
-        status_code: Optional[int] = None,
-        deprecated: Optional[bool] = None,
-        request_class: Union[Type[Request], DefaultPlaceholder] = Default(
-            Request,
-        ),
-        response_model: Optional[ma.Schema] = None,
-        response_class: Union[Type[Response], DefaultPlaceholder] = Default(
-            JSONResponse,
-        ),
+        middleware: Sequence[Middleware] = (),
+        status_code: int | None = None,
+        deprecated: bool | None = None,
+        request_class: type[Request] | DefaultPlaceholder = _DEFAULT_REQUEST_CLASS,
+        response_model: ma.Schema | None = None,
+        response_class: type[Response] | DefaultPlaceholder = _DEFAULT_RESPONSE_CLASS,
         # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
+        summary: str | None = None,
+        description: str | None = None,
         response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
+        responses: dict[int | str, dict[str, Any]] | None = None,
+        callbacks: list[BaseRoute] | None = None,
         # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
+        operation_id: str | None = None,
         # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Union[
-            Callable[["APIRoute"], str], DefaultPlaceholder,
-        ] = Default(generate_unique_id),
+        generate_unique_id_function: Callable[["APIRoute"], str] | DefaultPlaceholder = _DEFAULT_GENERATE_UNIQUE_ID,
         # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
+        tags: list[str | Enum] | None = None,
         # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
+        openapi_extra: dict[str, Any] | None = None,
     ) -> None:
         # Copied from starlette, without the path assertion
         self.path = path
@@ -270,6 +268,8 @@ class APIRoute(routing.Route, EndpointMixin):
         self.path_regex, self.path_format, self.param_convertors = compile_path(path)
         # End starlette copy
         assert callable(endpoint), "An endpoint must be a callable"
+        # Only plain functions and methods are documented in the OpenAPI schema, checked once here.
+        self._endpoint_is_func_or_method = inspect.isfunction(endpoint) or inspect.ismethod(endpoint)
 
         self.status_code = status_code
         self.deprecated = deprecated
@@ -293,9 +293,7 @@ class APIRoute(routing.Route, EndpointMixin):
 
         self.generate_unique_id_function = generate_unique_id_function
         if isinstance(generate_unique_id_function, DefaultPlaceholder):
-            current_generate_unique_id: Callable[
-                ["APIRoute"], str,
-            ] = generate_unique_id_function.value
+            current_generate_unique_id: Callable[[APIRoute], str] = generate_unique_id_function.value
         else:
             current_generate_unique_id = generate_unique_id_function
         self.unique_id = self.operation_id or current_generate_unique_id(self)
@@ -305,10 +303,12 @@ class APIRoute(routing.Route, EndpointMixin):
             status_code = int(status_code)
         self.status_code = status_code
 
-        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
-        # if a "form feed" character (page break) is found in the description text,
-        # truncate description text to the content preceding the first "form feed"
-        self.description = self.description.split("\f")[0]
+        if description:
+            # if a "form feed" character (page break) is found in the description text,
+            # truncate description text to the content preceding the first "form feed"
+            self.description = description.split("\f", 1)[0]
+        else:
+            self.description = _clean_description(self.endpoint.__doc__)
         self.response_description = response_description
 
         if self.response_model:
@@ -316,7 +316,7 @@ class APIRoute(routing.Route, EndpointMixin):
                 status_code not in STATUS_CODES_WITH_NO_BODY
             ), f"Status code {status_code} must not have a response body"
 
-        response_fields = {}
+        self.response_fields: dict[int | str, ma.Schema | mf.Field | None] = {}
         for additional_status_code, response in self.responses.items():
             assert isinstance(response, dict), "An additional response must be a dict"
             model = response.get("model")
@@ -327,12 +327,7 @@ class APIRoute(routing.Route, EndpointMixin):
                 # TODO: do we want this?
                 # response_name = f"Response_{additional_status_code}_{self.unique_id}"
                 # response_field = create_response_model(name=response_name, type_=model)
-                response_field = create_response_model(type_=model)
-                response_fields[additional_status_code] = response_field
-        if response_fields:
-            self.response_fields: Dict[Union[int, str], ma.Schema] = response_fields
-        else:
-            self.response_fields = {}
+                self.response_fields[additional_status_code] = create_response_model(type_=model)
 
         self.endpoint_model = self.get_endpoint_model(
             self.path_format,
@@ -347,7 +342,7 @@ class APIRoute(routing.Route, EndpointMixin):
 
         self.middleware = middleware  # Store for include_router
         self.app = request_response(self.get_route_handler(), self.request_class)
-        if middleware is not None:
+        if middleware:
             for cls, args, kwargs in reversed(middleware):
                 self.app = cls(app=self.app, *args, **kwargs)  # noqa: B026
 
@@ -355,29 +350,78 @@ class APIRoute(routing.Route, EndpointMixin):
         return get_request_handler(self.endpoint_model)
 
 
+class _VerbDecorator(Protocol):
+    """
+    Signature of the generated verb decorators (`get`, `post`, ...) for type checkers and IDEs.
+
+    The runtime implementation forwards its keyword arguments to `api_route`, which holds the defaults.
+    """
+
+    def __call__(
+        self,
+        path: str,
+        *,
+        name: str = ...,
+        include_in_schema: bool = ...,
+        status_code: int | None = ...,
+        middleware: Sequence[Middleware] = ...,
+        deprecated: bool | None = ...,
+        request_class: type[Request] = ...,
+        response_model: type[Any] | None = ...,
+        response_class: type[Response] = ...,
+        summary: str | None = ...,
+        description: str | None = ...,
+        response_description: str = ...,
+        responses: dict[int | str, dict[str, Any]] | None = ...,
+        callbacks: list[BaseRoute] | None = ...,
+        operation_id: str | None = ...,
+        generate_unique_id_function: Callable[[APIRoute], str] = ...,
+        tags: list[str | Enum] | None = ...,
+        openapi_extra: dict[str, Any] | None = ...,
+        route_class: type[APIRoute] | None = ...,
+    ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        ...
+
+
+def _make_verb_decorator(method: str) -> _VerbDecorator:
+    """
+    Creates a shortcut for `api_route` that registers the route for a single HTTP method.
+
+    All keyword arguments are passed through to `api_route`, which holds the defaults.
+    """
+
+    methods = frozenset((method,))
+
+    def verb_decorator(self, path: str, **kwargs: Any) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        return self.api_route(path, methods=methods, **kwargs)
+
+    verb_decorator.__name__ = verb_decorator.__qualname__ = method.lower()
+    verb_decorator.__doc__ = f"Shortcut for `api_route(path, methods=['{method}'], ...)`."
+    # Accessed through the class the function binds `self`, matching the `_VerbDecorator` signature.
+    return cast(_VerbDecorator, verb_decorator)
+
+
 class APIRouter(routing.Router):
 
     def __init__(
         self,
         *args,
-        tags: Optional[List[Union[str, Enum]]] = None,
-        default_request_class: Type[Request] = Default(Request),
-        default_response_class: Type[Response] = Default(JSONResponse),
-        deprecated: Optional[bool] = None,
+        tags: list[str | Enum] | None = None,
+        default_request_class: type[Request] = _DEFAULT_REQUEST_CLASS,
+        default_response_class: type[Response] = _DEFAULT_RESPONSE_CLASS,
+        deprecated: bool | None = None,
         include_in_schema: bool = True,
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        generate_unique_id_function: Callable[[APIRoute], str] = Default(
-            generate_unique_id,
-        ),
+        responses: dict[int | str, dict[str, Any]] | None = None,
+        callbacks: list[BaseRoute] | None = None,
+        generate_unique_id_function: Callable[[APIRoute], str] = _DEFAULT_GENERATE_UNIQUE_ID,
         prefix: str = "",
-        route_class: Optional[Type[APIRoute]] = APIRoute,
+        route_class: type[APIRoute] | None = APIRoute,
         middleware: Sequence[Middleware] | None = None,
         **kwargs,
     ) -> None:
         super().__init__(*args, middleware=middleware, **kwargs)
 
-        self.tags: List[Union[str, Enum]] = tags or []
+        self.tags: list[str | Enum] = tags or []
         self.default_request_class = default_request_class
         self.default_response_class = default_response_class
         self.deprecated = deprecated
@@ -392,8 +436,8 @@ class APIRouter(routing.Router):
     def route(
         self,
         path: str,
-        methods: Optional[List[str]] = None,
-        name: Optional[str] = None,
+        methods: list[str] | None = None,
+        name: str | None = None,
         include_in_schema: bool = True,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
@@ -411,32 +455,32 @@ class APIRouter(routing.Router):
     def add_api_route(
         self,
         path: str,
-        endpoint: Union[Callable[..., Any], APIHTTPEndpoint],
+        endpoint: Callable[..., Any] | APIHTTPEndpoint,
         *,
-        methods: Optional[Union[Set[str], List[str]]] = None,
+        methods: set[str] | frozenset[str] | list[str] | None = None,
         name: str = None,
         include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
+        status_code: int | None = None,
+        middleware: Sequence[Middleware] = (),
+        deprecated: bool | None = None,
+        request_class: type[Request] = _DEFAULT_REQUEST_CLASS,
+        response_model: type[Any] | None = None,
+        response_class: type[Response] = JSONResponse,
         # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
+        summary: str | None = None,
+        description: str | None = None,
         response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
+        responses: dict[int | str, dict[str, Any]] | None = None,
+        callbacks: list[BaseRoute] | None = None,
         # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
+        operation_id: str | None = None,
         # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
+        generate_unique_id_function: Callable[[APIRoute], str] = _DEFAULT_GENERATE_UNIQUE_ID,
         # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
+        tags: list[str | Enum] | None = None,
         # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
+        openapi_extra: dict[str, Any] | None = None,
+        route_class: type[APIRoute] | None = None,
     ) -> None:
         route_class = route_class or self.route_class
 
@@ -516,30 +560,30 @@ class APIRouter(routing.Router):
         self,
         path: str,
         *,
-        methods: Optional[Union[Set[str], List[str]]] = None,
+        methods: set[str] | frozenset[str] | list[str] | None = None,
         name: str = None,
         include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
+        status_code: int | None = None,
+        middleware: Sequence[Middleware] = (),
+        deprecated: bool | None = None,
+        request_class: type[Request] = _DEFAULT_REQUEST_CLASS,
+        response_model: type[Any] | None = None,
+        response_class: type[Response] = JSONResponse,
         # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
+        summary: str | None = None,
+        description: str | None = None,
         response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
+        responses: dict[int | str, dict[str, Any]] | None = None,
+        callbacks: list[BaseRoute] | None = None,
         # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
+        operation_id: str | None = None,
         # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
+        generate_unique_id_function: Callable[[APIRoute], str] = _DEFAULT_GENERATE_UNIQUE_ID,
         # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
+        tags: list[str | Enum] | None = None,
         # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
+        openapi_extra: dict[str, Any] | None = None,
+        route_class: type[APIRoute] | None = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.add_api_route(
@@ -569,7 +613,7 @@ class APIRouter(routing.Router):
         return decorator
 
     def add_api_websocket_route(
-        self, path: str, endpoint: Callable[..., Any], name: Optional[str] = None,
+        self, path: str, endpoint: Callable[..., Any], name: str | None = None,
     ) -> None:
         route = APIWebSocketRoute(
             self.prefix + path,
@@ -579,7 +623,7 @@ class APIRouter(routing.Router):
         self.routes.append(route)
 
     def websocket(
-        self, path: str, name: Optional[str] = None,
+        self, path: str, name: str | None = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.add_api_websocket_route(path, func, name=name)
@@ -588,7 +632,7 @@ class APIRouter(routing.Router):
         return decorator
 
     def websocket_route(
-        self, path: str, name: Union[str, None] = None,
+        self, path: str, name: str | None = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.add_websocket_route(path, func, name=name)
@@ -601,14 +645,14 @@ class APIRouter(routing.Router):
         router: "APIRouter",
         *,
         prefix: str = "",
-        tags: Optional[List[Union[str, Enum]]] = None,
-        default_request_class: Type[Request] = Default(Request),
-        default_response_class: Type[Response] = Default(JSONResponse),
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        deprecated: Optional[bool] = None,
+        tags: list[str | Enum] | None = None,
+        default_request_class: type[Request] = _DEFAULT_REQUEST_CLASS,
+        default_response_class: type[Response] = _DEFAULT_RESPONSE_CLASS,
+        responses: dict[int | str, dict[str, Any]] | None = None,
+        callbacks: list[BaseRoute] | None = None,
+        deprecated: bool | None = None,
         include_in_schema: bool = True,
-        generate_unique_id_function: Callable[[APIRoute], str] = Default(generate_unique_id),
+        generate_unique_id_function: Callable[[APIRoute], str] = _DEFAULT_GENERATE_UNIQUE_ID,
     ) -> None:
         if prefix:
             assert prefix.startswith("/"), "A path prefix must start with '/'"
@@ -714,410 +758,11 @@ class APIRouter(routing.Router):
         for handler in router.on_shutdown:
             self.add_event_handler("shutdown", handler)
 
-    def get(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
-    ):
-        return self.api_route(
-            path,
-            methods=['GET'],
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            deprecated=deprecated,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-            route_class=route_class,
-        )
-
-    def put(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
-    ):
-        return self.api_route(
-            path,
-            methods=['PUT'],
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            deprecated=deprecated,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-            route_class=route_class,
-        )
-
-    def post(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
-    ):
-        return self.api_route(
-            path,
-            methods=['POST'],
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            deprecated=deprecated,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-            route_class=route_class,
-        )
-
-    def delete(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
-    ):
-        return self.api_route(
-            path,
-            methods=['DELETE'],
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            deprecated=deprecated,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-            route_class=route_class,
-        )
-
-    def options(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
-    ):
-        return self.api_route(
-            path,
-            methods=['OPTIONS'],
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            deprecated=deprecated,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-            route_class=route_class,
-        )
-
-    def head(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
-    ):
-        return self.api_route(
-            path,
-            methods=['HEAD'],
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            deprecated=deprecated,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-            route_class=route_class,
-        )
-
-    def patch(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
-    ):
-        return self.api_route(
-            path,
-            methods=['PATCH'],
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            deprecated=deprecated,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-            route_class=route_class,
-        )
-
-    def trace(
-        self,
-        path: str,
-        *,
-        name: str = None,
-        include_in_schema: bool = True,
-        status_code: Optional[int] = None,
-        middleware: Sequence[Middleware] | None = None,
-        deprecated: Optional[bool] = None,
-        request_class: Type[Request] = Default(Request),
-        response_model: Optional[Type[Any]] = None,
-        response_class: Type[Response] = JSONResponse,
-        # OpenAPI summary
-        summary: Optional[str] = None,
-        description: Optional[str] = None,
-        response_description: str = "Successful Response",
-        responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
-        callbacks: Optional[List[BaseRoute]] = None,
-        # Sets the OpenAPI operationId to be used in your path operation
-        operation_id: Optional[str] = None,
-        # If operation_id is None, this function will be used to create one.
-        generate_unique_id_function: Callable[["APIRoute"], str] = Default(generate_unique_id),
-        # OpenAPI tags
-        tags: Optional[List[Union[str, Enum]]] = None,
-        # Will be deeply merged with the automatically generated OpenAPI schema for the path operation.
-        openapi_extra: Optional[Dict[str, Any]] = None,
-        route_class: Optional[Type[APIRoute]] = None,
-    ):
-        return self.api_route(
-            path,
-            methods=['TRACE'],
-            name=name,
-            include_in_schema=include_in_schema,
-            status_code=status_code,
-            middleware=middleware,
-            deprecated=deprecated,
-            request_class=request_class,
-            response_model=response_model,
-            response_class=response_class,
-            summary=summary,
-            description=description,
-            response_description=response_description,
-            responses=responses,
-            callbacks=callbacks,
-            operation_id=operation_id,
-            generate_unique_id_function=generate_unique_id_function,
-            openapi_extra=openapi_extra,
-            tags=tags,
-            route_class=route_class,
-        )
+    get = _make_verb_decorator('GET')
+    put = _make_verb_decorator('PUT')
+    post = _make_verb_decorator('POST')
+    delete = _make_verb_decorator('DELETE')
+    options = _make_verb_decorator('OPTIONS')
+    head = _make_verb_decorator('HEAD')
+    patch = _make_verb_decorator('PATCH')
+    trace = _make_verb_decorator('TRACE')
@@ -1,3 +1,5 @@
+import copy
+import functools
 import http.client
 import inspect
 import itertools
@@ -5,12 +7,13 @@ import re
 import warnings
 from collections import defaultdict
 from logging import getLogger
-from typing import Any, Dict, Generator, List, Optional, Sequence, Set, Tuple, Type
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type
 
 import marshmallow as ma
 import marshmallow.fields as mf
 from apispec import APISpec
 from apispec.ext.marshmallow import OpenAPIConverter, SchemaResolver
+from apispec.ext.marshmallow.common import make_schema_key
 # from apispec.ext.marshmallow.openapi import OpenAPIConverter
 from starlette.responses import Response
 from starlette.routing import BaseRoute, Mount, compile_path
@@ -19,45 +22,104 @@ from starlette.schemas import BaseSchemaGenerator
 from starmallow.datastructures import DefaultPlaceholder
 from starmallow.endpoint import EndpointModel, SchemaModel
 from starmallow.ext.marshmallow import MarshmallowPlugin
-from starmallow.params import Body, Cookie, Header, Path, Query
+from starmallow.params import Body
 from starmallow.responses import HTTPValidationError
 from starmallow.routing import APIRoute
 from starmallow.security.base import SecurityBaseResolver
 from starmallow.utils import (
     deep_dict_update,
     dict_safe_add,
+    ensure_dict_path,
     is_marshmallow_field,
     status_code_ranges,
 )
 
 logger = getLogger(__name__)
 
-class SchemaRegistry(dict):
+_CAMEL_RE = re.compile(r"(\w)([A-Z])")
+_SUMMARY_TRANSLATION = str.maketrans("._", "  ")
+
+# Description for every standard status code and status code range, keyed by the upper-cased key.
+_STATUS_TEXT: Dict[str, str] = {
+    **{str(int(status_code)): text for status_code, text in http.client.responses.items()},
+    **status_code_ranges,
+}
+
+# An endpoint that documents any of these doesn't get the default validation error response.
+_VALIDATION_STATUS_KEYS = frozenset(("422", "4XX", "default"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path_format(path: str) -> str:
+    _, path_format, _ = compile_path(path)
+    return path_format
+
+
+def _in_schema(route: APIRoute) -> bool:
+    '''
+        Whether the route has any operations to document. get_operations creates one per method besides HEAD.
+    '''
+    return (
+        route.include_in_schema
+        and route._endpoint_is_func_or_method
+        and any(method != 'HEAD' for method in route.methods or ('GET',))
+    )
+
+
+def _new_body_component(title: str) -> Dict[str, Any]:
+    return {
+        "title": title,
+        "type": "object",
+        "properties": {},
+        "required": [],
+    }
+
+
+class SchemaRegistry:
     '''
-        Dict that holds all the schemas for each class and lazily resolves them.
+        Holds all the schemas for each class and lazily resolves them.
     '''
+    __slots__ = (
+        'spec',
+        'converter',
+        'resolver',
+        '_class_cache',
+        'security_references',
+        '_instance_cache',
+        '_field_cache',
+    )
+
     def __init__(
         self,
         spec: APISpec,
         converter: OpenAPIConverter,
         resolver: SchemaResolver,
-        *args,
-        **kwargs,
     ):
-        super().__init__(*args, **kwargs)
         self.spec = spec
         self.converter = converter
         self.resolver = resolver
+        # Resolved schemas by schema class
+        self._class_cache: Dict[Type[ma.Schema], Dict[str, Any]] = {}
         # Cache security schemas seperately
         self.security_references = {}
+        # Resolved schema instances by schema key and many
+        self._instance_cache: Dict[Tuple[Tuple, bool], Dict[str, Any]] = {}
+        # Converted fields by id, holding on to the field so the id can't be reused.
+        self._field_cache: Dict[int, Tuple[mf.Field, Dict[str, Any]]] = {}
+
+    def _get_field_item(self, item: mf.Field | Type[mf.Field]):
+        cached = self._field_cache.get(id(item))
+        if cached is None:
+            cached = (item, self.converter.field2property(item))
+            self._field_cache[id(item)] = cached
+        return cached[1]
 
     def _get_security_item(self, item: SecurityBaseResolver):
         component_id = item.__class__.__name__
         model = item.model
 
-        try:
-            sec_obj = self.security_references.__getitem__(component_id)
-        except KeyError:
+        sec_obj = self.security_references.get(component_id)
+        if sec_obj is None:
             # Use marshmallow_dataclass to dump itself
             sec_schema = model.Schema().dump(model)
             sec_schema['type'] = model.type.value
@@ -66,41 +128,60 @@ class SchemaRegistry(dict):
 
             # TODO: fix scopes for oauth
             sec_obj = {component_id: []}
-            self.security_references.__setitem__(component_id, sec_obj)
+            self.security_references[component_id] = sec_obj
 
         return sec_obj
 
-    def __getitem__(self, item):
-        if isinstance(item, SecurityBaseResolver):
-            return self._get_security_item(item)
+    def _register_component(self, schema_class: Type[ma.Schema], item: ma.Schema | Type[ma.Schema]):
+        component_id = schema_class.__name__
+        if component_id not in self.spec.components.schemas:
+            self.spec.components.schema(component_id=component_id, schema=item)
 
-        if is_marshmallow_field(item):
-            # If marshmallow field, just resolve it here without caching
-            prop = self.converter.field2property(item)
-            return prop
+    def _get_schema_class_item(self, schema_class: Type[ma.Schema]):
+        schema = self._class_cache.get(schema_class)
+        if schema is None:
+            self._register_component(schema_class, schema_class)
+            schema = self.resolver.resolve_schema_dict(schema_class)
+            self._class_cache[schema_class] = schema
+
+        return schema
+
+    def _get_schema_instance_item(self, item: ma.Schema):
+        # Instances of the same class with the same modifiers resolve to the same schema,
+        # which is how apispec itself tells schemas apart. many wraps the schema in an array.
+        key = (make_schema_key(item), item.many)
+        schema = self._instance_cache.get(key)
+        if schema is None:
+            self._register_component(item.__class__, item)
+            schema = self.resolver.resolve_schema_dict(item)
+            self._instance_cache[key] = schema
+
+        return schema
 
+    def get_for(self, item):
+        '''
+            Returns the OpenAPI schema for a schema (class), field or security resolver.
+        '''
         if isinstance(item, SchemaModel):
             item = item.schema
 
-        is_class = inspect.isclass(item)
-        schema_class = item if is_class else item.__class__
+        # Ordered by how often each kind is looked up.
+        if isinstance(item, ma.Schema):
+            return self._get_schema_instance_item(item)
 
-        try:
-            schema = super().__getitem__(schema_class)
-        except KeyError:
-            component_id = schema_class.__name__
-            try:
-                schema = self.spec.components.schemas.__getitem__(component_id)
-            except KeyError:
-                self.spec.components.schema(component_id=component_id, schema=item)
+        if is_marshmallow_field(item):
+            return self._get_field_item(item)
 
-            schema = self.resolver.resolve_schema_dict(item)
-            super().__setitem__(schema_class, schema)
+        if isinstance(item, SecurityBaseResolver):
+            return self._get_security_item(item)
 
-        if not is_class:
-            schema = self.resolver.resolve_schema_dict(item)
+        if inspect.isclass(item):
+            return self._get_schema_class_item(item)
 
-        return schema
+        return self.resolver.resolve_schema_dict(item)
+
+    # Kept so existing `registry[item]` lookups keep working.
+    __getitem__ = get_for
 
 
 class SchemaGenerator(BaseSchemaGenerator):
@@ -131,6 +212,10 @@ class SchemaGenerator(BaseSchemaGenerator):
         self.schemas = SchemaRegistry(self.spec, self.converter, self.resolver)
 
         self.operation_ids: Set[str] = set()
+        # Converted parameters by (id(field), name, location), holding on to the field so the id can't be reused.
+        self._parameter_cache: Dict[Tuple[int, str, str], Tuple[mf.Field, Dict[str, Any]]] = {}
+        # Resolved on first use, not every spec has endpoints that can fail validation.
+        self._validation_error_schema: Optional[Dict[str, Any]] = None
 
     def get_endpoints(
         self,
@@ -151,90 +236,96 @@ class SchemaGenerator(BaseSchemaGenerator):
             This allows each path to have multiple responses.
         """
 
-        endpoints_info: Dict[str, Sequence[APIRoute]] = defaultdict(list)
-
-        for route in routes:
-            # path is not defined in BaseRoute, but all implementations have it.
-            _, path, _ = compile_path(base_path + route.path)
-
-            if isinstance(route, APIRoute) and route.include_in_schema:
-                if inspect.isfunction(route.endpoint) or inspect.ismethod(route.endpoint):
-                    for method in (route.methods or ['GET']):
-                        if method == 'HEAD':
-                            continue
-
-                        endpoints_info[path].append(route.endpoint_model)
-
-            elif isinstance(route, Mount):
-                endpoints_info.update(self.get_endpoints(route.routes, base_path=path))
+        endpoints_info: Dict[str, List[EndpointModel]] = defaultdict(list)
+
+        # Walk Mounts depth first with a stack of iterators, so paths keep the order the routes were declared in.
+        stack = [(iter(routes), base_path)]
+        while stack:
+            routes_iter, prefix = stack[-1]
+            for route in routes_iter:
+                if isinstance(route, APIRoute):
+                    if _in_schema(route):
+                        endpoints_info[_compile_path_format(prefix + route.path)].append(route.endpoint_model)
+
+                elif isinstance(route, Mount):
+                    # The full path is compiled once we reach the endpoint, so only the raw prefix is needed here.
+                    stack.append((iter(route.routes), prefix + route.path))
+                    break
+            else:
+                stack.pop()
 
         return endpoints_info
 
-    def _to_parameters(self, *params: Dict[str, Query | Path | Header | Cookie]) -> Generator[Dict[str, Any], None, None]:
-        for name, field in itertools.chain(*(p.items() for p in params)):
-            if not field.include_in_schema:
-                continue
-
-            if isinstance(field.model, SchemaModel):
-                for field_name, ma_field in field.model.schema.load_fields.items():
-                    yield self.converter._field2parameter(
-                        ma_field,
-                        name=field_name,
-                        location=field.in_.name,
-                    )
-
-            else:
-                yield self.converter._field2parameter(
-                    field.model,
-                    name=name,
-                    location=field.in_.name,
-                )
+    def _field2parameter(self, ma_field: mf.Field, name: str, location: str) -> Dict[str, Any]:
+        key = (id(ma_field), name, location)
+        cached = self._parameter_cache.get(key)
+        if cached is None:
+            cached = (ma_field, self.converter._field2parameter(ma_field, name=name, location=location))
+            self._parameter_cache[key] = cached
+        return cached[1]
 
     def _add_endpoint_parameters(
         self,
         endpoint: EndpointModel,
         schema: Dict,
     ):
-        unique_params = {}
-        for param in self._to_parameters(
-            endpoint.query_params,
-            endpoint.path_params,
-            endpoint.header_params,
-            endpoint.cookie_params,
-        ):
-            if (param['name'] in unique_params):
-                if unique_params[param['name']] == param:
+        parameters: List[Dict[str, Any]] = []
+        append = parameters.append
+        field2parameter = self._field2parameter
+        # Each source holds a single location, so only expanded schemas can introduce duplicates.
+        has_schema_models = False
+        for location, name, field in endpoint.schema_params:
+            model = field.model
+            if isinstance(model, SchemaModel):
+                has_schema_models = True
+                for field_name, ma_field in model.schema.load_fields.items():
+                    append(field2parameter(ma_field, field_name, location))
+            else:
+                append(field2parameter(model, name, location))
+
+        if has_schema_models:
+            parameters = self._dedupe_parameters(parameters)
+
+        schema["parameters"] = parameters
+
+    def _dedupe_parameters(self, parameters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        unique_params: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for param in parameters:
+            key = (param['name'], param['in'])
+            existing = unique_params.get(key)
+            if existing is not None:
+                if existing == param:
                     # Duplicate parameter, skip. Could be defined as a field and in a schema.
                     continue
-                else:
-                    raise ValueError(f"Duplicate parameter with name {param['name']} and location {param['in']}")
+                raise ValueError(f"Duplicate parameter with name {key[0]} and location {key[1]}")
 
-            unique_params[param['name']] = param
+            unique_params[key] = param
 
-        schema["parameters"] = list(unique_params.values())
+        return list(unique_params.values())
 
     def _add_endpoint_body(
         self,
         endpoint: EndpointModel,
         schema: Dict,
     ):
-        all_body_params: List[Tuple[str, Body]] = [
-            *endpoint.body_params.items(),
-            *endpoint.form_params.items(),
-        ]
+        body_params = endpoint.body_params
+        form_params = endpoint.form_params
         schema_by_media_type = {}
         is_body_required = True
 
+        body_param: Optional[Body] = None
+        if len(body_params) + len(form_params) == 1:
+            body_param = next(iter((body_params or form_params).values()))
+
         # If only 1 schema is defined. Use it as the entire schema.
-        if len(all_body_params) == 1 and isinstance(all_body_params[0][1].model, ma.Schema):
-            body_param = all_body_params[0][1]
+        if body_param is not None and isinstance(body_param.model, ma.Schema):
             if body_param.include_in_schema:
-                endpoint_schema = self.schemas[body_param.model]
-
-            if endpoint_schema:
-                schema_by_media_type[body_param.media_type] = {'schema': endpoint_schema}
+                endpoint_schema = self.schemas.get_for(body_param.model)
+                if endpoint_schema:
+                    schema_by_media_type[body_param.media_type] = {'schema': endpoint_schema}
 
-            if getattr(body_param.model, 'required', True) is False:
+            # Only SchemaModel has a required flag, plain schemas are always required.
+            if isinstance(body_param.model, SchemaModel) and body_param.model.required is False:
                 is_body_required = False
 
         # Otherwise, loop over all body params and build a new schema from the key value pairs.
@@ -243,29 +334,24 @@ class SchemaGenerator(BaseSchemaGenerator):
             operation_id = endpoint.route.operation_id or endpoint.route.unique_id
             component_schema_id = f'Body_{operation_id}'
 
-            def new_endpoint_schema():
-                return {
-                    "title": component_schema_id,
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                }
-
-            component_by_media_type = defaultdict(new_endpoint_schema)
-            for name, value in all_body_params:
+            component_by_media_type = defaultdict(functools.partial(_new_body_component, component_schema_id))
+            get_for = self.schemas.get_for
+            for name, value in itertools.chain(body_params.items(), form_params.items()):
                 media_component = component_by_media_type[value.media_type]
                 endpoint_properties: Dict[str, Any] = media_component['properties']
                 required_properties: List[Any] = media_component['required']
 
                 if value.include_in_schema:
-                    if isinstance(value.model, ma.Schema):
-                        endpoint_properties[name] = self.schemas[value.model]
-                        if isinstance(value.model, SchemaModel) and value.model.required:
+                    model = value.model
+                    if isinstance(model, ma.Schema):
+                        endpoint_properties[name] = get_for(model)
+                        if isinstance(model, SchemaModel) and model.required:
                             required_properties.append(name)
 
-                    elif isinstance(value.model, mf.Field):
-                        endpoint_properties[name] = self.converter.field2property(value.model)
-                        if value.model.required:
+                    elif isinstance(model, mf.Field):
+                        # Goes through the registry's field cache rather than converting the field again.
+                        endpoint_properties[name] = get_for(model)
+                        if model.required:
                             required_properties.append(name)
 
             if len(component_by_media_type) > 1:
@@ -292,9 +378,10 @@ class SchemaGenerator(BaseSchemaGenerator):
         endpoint: EndpointModel,
         schema: Dict,
     ):
+        get_for = self.schemas.get_for
         schema['security'] = [
-            self.schemas[security_param.resolver]
-            for param_name, security_param in endpoint.security_params.items()
+            get_for(security_param.resolver)
+            for security_param in endpoint.security_params.values()
         ]
 
     def _add_endpoint_response(
@@ -303,13 +390,12 @@ class SchemaGenerator(BaseSchemaGenerator):
         schema: Dict,
     ):
         operation_responses = schema.setdefault("responses", {})
-        response_codes = list(operation_responses.keys())
-        main_response = str(endpoint.status_code or (response_codes[0] if response_codes else 200))
+        main_response = str(endpoint.status_code or next(iter(operation_responses), 200))
 
         operation_responses[main_response] = {
             'content': {
                 endpoint.response_class.media_type: {
-                    'schema': self.schemas[endpoint.response_model] if endpoint.response_model else {},
+                    'schema': self.schemas.get_for(endpoint.response_model) if endpoint.response_model else {},
                 },
             },
         }
@@ -318,14 +404,15 @@ class SchemaGenerator(BaseSchemaGenerator):
 
         # Process additional responses
         route = endpoint.route
-        if isinstance(route.response_class, DefaultPlaceholder):
-            current_response_class: Type[Response] = route.response_class.value
-        else:
-            current_response_class = route.response_class
-        assert current_response_class, "A response class is needed to generate OpenAPI"
-        route_response_media_type: Optional[str] = current_response_class.media_type
-
         if route.responses:
+            if isinstance(route.response_class, DefaultPlaceholder):
+                current_response_class: Type[Response] = route.response_class.value
+            else:
+                current_response_class = route.response_class
+            assert current_response_class, "A response class is needed to generate OpenAPI"
+            additional_media_type = current_response_class.media_type or "application/json"
+
+            response_fields = route.response_fields
             for (
                 additional_status_code,
                 additional_response,
@@ -333,38 +420,45 @@ class SchemaGenerator(BaseSchemaGenerator):
                 assert isinstance(
                     additional_response, dict,
                 ), "An additional response must be a dict"
-                process_response = additional_response.copy()
-                process_response.pop("model", None)
-                status_code_key = str(additional_status_code).upper()
-                if status_code_key == "DEFAULT":
-                    status_code_key = "default"
+                if "model" in additional_response:
+                    process_response = {k: v for k, v in additional_response.items() if k != "model"}
+                else:
+                    # Only read from here on, the body schema below is only added when there's a model.
+                    process_response = additional_response
+                upper_status_code = str(additional_status_code).upper()
+                status_code_key = "default" if upper_status_code == "DEFAULT" else upper_status_code
                 openapi_response = operation_responses.setdefault(
                     status_code_key, {},
                 )
-                field = route.response_fields.get(additional_status_code)
-                additional_field_schema: Optional[Dict[str, Any]] = None
+                field = response_fields.get(additional_status_code)
                 if field:
-                    additional_field_schema = self.schemas[field] if field else {}
-                    media_type = route_response_media_type or "application/json"
-                    additional_schema = (
-                        process_response.setdefault("content", {})
-                        .setdefault(media_type, {})
-                        .setdefault("schema", {})
-                    )
-                    deep_dict_update(additional_schema, additional_field_schema)
-                status_text: Optional[str] = status_code_ranges.get(
-                    str(additional_status_code).upper(),
-                ) or http.client.responses.get(int(additional_status_code))
+                    additional_field_schema = self.schemas.get_for(field)
+                    additional_schema = ensure_dict_path(process_response, "content", additional_media_type, "schema")
+                    if additional_schema:
+                        deep_dict_update(additional_schema, additional_field_schema)
+                    else:
+                        # Nothing to merge into, which is the common case.
+                        additional_schema.update(additional_field_schema)
+                status_text: Optional[str] = _STATUS_TEXT.get(upper_status_code)
+                if status_text is None:
+                    # Not a known code or range, int() rejects keys that aren't status codes at all.
+                    status_text = http.client.responses.get(int(additional_status_code))
                 description = (
                     process_response.get("description")
                     or openapi_response.get("description")
                     or status_text
                     or "Additional Response"
                 )
-                deep_dict_update(openapi_response, process_response)
+                if openapi_response:
+                    deep_dict_update(openapi_response, process_response)
+                else:
+                    openapi_response.update(process_response)
                 openapi_response["description"] = description
 
     def _add_default_error_response(self, schema: Dict):
+        if self._validation_error_schema is None:
+            self._validation_error_schema = self.schemas.get_for(HTTPValidationError)
+
         dict_safe_add(
             schema,
             'responses.422.description',
@@ -373,21 +467,18 @@ class SchemaGenerator(BaseSchemaGenerator):
         dict_safe_add(
             schema,
             'responses.422.content.application/json.schema',
-            self.schemas[HTTPValidationError],
+            self._validation_error_schema,
         )
 
     def _generate_openapi_summary(self, route: APIRoute) -> str:
         if route.summary:
             return route.summary
-        return re.sub(r"(\w)([A-Z])", r"\1 \2", route.name).replace(".", " ").replace("_", " ").title()
+        return _CAMEL_RE.sub(r"\1 \2", route.name).translate(_SUMMARY_TRANSLATION).title()
 
-    def _get_route_openapi_metadata(self, route: APIRoute) -> Dict[str, Any]:
-        schema = {}
-        if route.tags:
-            schema["tags"] = route.tags
-        schema["summary"] = self._generate_openapi_summary(route=route)
-        if route.description:
-            schema["description"] = route.description
+    def _register_operation_id(self, route: APIRoute) -> None:
+        '''
+            Records the route's operationId, warning when an operation emitted before already uses it.
+        '''
         operation_id = route.operation_id or route.unique_id
         if operation_id in self.operation_ids:
             message = (
@@ -399,7 +490,15 @@ class SchemaGenerator(BaseSchemaGenerator):
                 message += f" at {file_name}"
             warnings.warn(message)
         self.operation_ids.add(operation_id)
-        schema["operationId"] = operation_id
+
+    def _get_route_openapi_metadata(self, route: APIRoute) -> Dict[str, Any]:
+        schema = {}
+        if route.tags:
+            schema["tags"] = route.tags
+        schema["summary"] = self._generate_openapi_summary(route=route)
+        if route.description:
+            schema["description"] = route.description
+        schema["operationId"] = route.operation_id or route.unique_id
         if route.deprecated:
             schema["deprecated"] = route.deprecated
 
@@ -438,9 +537,9 @@ class SchemaGenerator(BaseSchemaGenerator):
         self._add_endpoint_response(endpoint, schema)
 
         # Add default error response
-        if (any_params or endpoint.body_params or endpoint.form_params) and not any(
-            status in schema['responses']
-                for status in ["422", "4XX", "default"]
+        if (
+            (any_params or endpoint.body_params or endpoint.form_params)
+            and schema['responses'].keys().isdisjoint(_VALIDATION_STATUS_KEYS)
         ):
             self._add_default_error_response(schema)
 
@@ -449,22 +548,40 @@ class SchemaGenerator(BaseSchemaGenerator):
             callbacks = {}
             for callback in endpoint.route.callbacks:
                 if isinstance(callback, APIRoute):
-                    callbacks[callback.name] = {
-                        path: self.get_operations(endpoints)
-                        for path, endpoints in self.get_endpoints([callback]).items()
-                    }
+                    # A callback is a single route, so skip get_endpoints and build its only path directly.
+                    callback_paths = {}
+                    if _in_schema(callback):
+                        path = _compile_path_format(callback.path)
+                        callback_paths[path] = self.get_operations([callback.endpoint_model])
+
+                    callbacks[callback.name] = callback_paths
 
             schema['callbacks'] = callbacks
 
         return schema
 
     def get_operations(self, endpoints: List[EndpointModel]):
-        return {
-            method.lower(): self.get_endpoint_schema(e)
-            for e in endpoints
-            for method in e.methods
-            if method != 'HEAD'
-        }
+        operations = {}
+        for e in endpoints:
+            methods = e.methods
+            if not methods:
+                continue
+
+            schema = None
+            for method in methods:
+                if method == 'HEAD':
+                    continue
+
+                # Every emitted operation counts, so repeated methods and mounts of the same route are reported too.
+                self._register_operation_id(e.route)
+                if schema is None:
+                    schema = self.get_endpoint_schema(e)
+                    operations[method.lower()] = schema
+                else:
+                    # apispec cleans up each operation in place, so every method needs its own copy.
+                    operations[method.lower()] = copy.deepcopy(schema)
+
+        return operations
 
     def get_schema(
         self,
@@ -24,6 +24,8 @@ class APIKeyModel(SecurityBase):
 
 
 class APIKeyQuery(SecurityBaseResolver):
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -49,6 +51,8 @@ class APIKeyQuery(SecurityBaseResolver):
 
 
 class APIKeyHeader(SecurityBaseResolver):
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -74,6 +78,8 @@ class APIKeyHeader(SecurityBaseResolver):
 
 
 class APIKeyCookie(SecurityBaseResolver):
+    __slots__ = ()
+
     def __init__(
         self,
         *,
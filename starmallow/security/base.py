@@ -21,15 +21,15 @@ class SecurityBase:
 
     @ma.post_dump()
     def post_dump(self, data: Dict[str, Any], **kwargs):
-        # Remove None values
-        return {
-            key: value
-            for key, value in data.items()
-            if value is not None
-        }
+        # Remove None values, in place since the dumped dict is ours
+        for key in [key for key, value in data.items() if value is None]:
+            del data[key]
+        return data
 
 
 class SecurityBaseResolver:
+    __slots__ = ('model', 'schema_name', 'scheme_name', 'auto_error')
+
     # I've thought about making this a dataclass, but then we'd have to use __post_init__ etc and it gets
     # more complicated to understand than just basic __init__
 
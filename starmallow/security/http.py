@@ -1,5 +1,4 @@
 import binascii
-from base64 import b64decode
 from typing import ClassVar, Optional
 
 from marshmallow_dataclass import dataclass as ma_dataclass
@@ -8,7 +7,12 @@ from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
 
 from starmallow.exceptions import HTTPException
 from starmallow.security.base import SecurityBase, SecurityBaseResolver, SecurityTypes
-from starmallow.security.utils import get_authorization_scheme_param
+from starmallow.security.utils import get_authorization_scheme_param, match_authorization_scheme
+
+try:
+    from pybase64 import b64decode
+except ImportError:  # pragma: nocover
+    from base64 import b64decode  # type: ignore
 
 
 @ma_dataclass(frozen=True)
@@ -44,6 +48,7 @@ class HTTPBearerModel(HTTPBaseModel):
 
 
 class HTTPBase(SecurityBaseResolver):
+    __slots__ = ()
 
     def __init__(
         self,
@@ -73,6 +78,7 @@ class HTTPBase(SecurityBaseResolver):
 
 
 class HTTPBasic(HTTPBase):
+    __slots__ = ('realm',)
 
     def __init__(
         self,
@@ -96,35 +102,35 @@ class HTTPBasic(HTTPBase):
     ) -> Optional[HTTPBasicCredentials]:
         authorization = request.headers.get("Authorization")
         scheme, param = get_authorization_scheme_param(authorization)
-        if self.realm:
-            unauthorized_headers = {"WWW-Authenticate": f'Basic realm="{self.realm}"'}
-        else:
-            unauthorized_headers = {"WWW-Authenticate": "Basic"}
-        invalid_user_credentials_exc = HTTPException(
-            status_code=HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers=unauthorized_headers,
-        )
         if not authorization or scheme.lower() != "basic":
             if self.auto_error:
-                raise HTTPException(
-                    status_code=HTTP_401_UNAUTHORIZED,
-                    detail="Not authenticated",
-                    headers=unauthorized_headers,
-                )
+                raise self._unauthorized_exception("Not authenticated")
             else:
                 return None
         try:
             data = b64decode(param).decode("ascii")
-        except (ValueError, UnicodeDecodeError, binascii.Error):
-            raise invalid_user_credentials_exc
+        except (ValueError, UnicodeDecodeError, binascii.Error) as e:
+            raise self._unauthorized_exception("Invalid authentication credentials") from e
         username, separator, password = data.partition(":")
         if not separator:
-            raise invalid_user_credentials_exc
+            raise self._unauthorized_exception("Invalid authentication credentials")
         return HTTPBasicCredentials(username=username, password=password)
 
+    def _unauthorized_exception(self, detail: str) -> HTTPException:
+        # Only built when authentication fails, successful requests don't need the headers.
+        if self.realm:
+            unauthorized_headers = {"WWW-Authenticate": f'Basic realm="{self.realm}"'}
+        else:
+            unauthorized_headers = {"WWW-Authenticate": "Basic"}
+        return HTTPException(
+            status_code=HTTP_401_UNAUTHORIZED,
+            detail=detail,
+            headers=unauthorized_headers,
+        )
+
 
 class HTTPBearer(HTTPBase):
+    __slots__ = ()
 
     def __init__(
         self,
@@ -142,6 +148,10 @@ class HTTPBearer(HTTPBase):
         self, request: Request,
     ) -> Optional[HTTPAuthorizationCredentials]:
         authorization = request.headers.get("Authorization")
+        matched = match_authorization_scheme(authorization, "bearer")
+        if matched is not None and matched[1]:
+            return HTTPAuthorizationCredentials(scheme=matched[0], credentials=matched[1])
+
         scheme, credentials = get_authorization_scheme_param(authorization)
         if not (authorization and scheme and credentials):
             if self.auto_error:
@@ -162,6 +172,7 @@ class HTTPBearer(HTTPBase):
 
 
 class HTTPDigest(HTTPBase):
+    __slots__ = ()
 
     def __init__(
         self,
@@ -181,6 +192,10 @@ class HTTPDigest(HTTPBase):
         self, request: Request,
     ) -> Optional[HTTPAuthorizationCredentials]:
         authorization = request.headers.get("Authorization")
+        matched = match_authorization_scheme(authorization, "digest")
+        if matched is not None and matched[1]:
+            return HTTPAuthorizationCredentials(scheme=matched[0], credentials=matched[1])
+
         scheme, credentials = get_authorization_scheme_param(authorization)
         if not (authorization and scheme and credentials):
             if self.auto_error:
@@ -9,7 +9,7 @@ from starmallow.dataclasses import optional_field, required_field
 from starmallow.exceptions import HTTPException
 from starmallow.params import Form
 from starmallow.security.base import SecurityBase, SecurityBaseResolver, SecurityTypes
-from starmallow.security.utils import get_authorization_scheme_param
+from starmallow.security.utils import get_authorization_scheme_param, match_authorization_scheme
 
 
 # region - Models
@@ -124,7 +124,8 @@ class OAuth2PasswordRequestForm:
         self.grant_type = grant_type
         self.username = username
         self.password = password
-        self.scopes = scope.split()
+        # Most requests don't ask for any scopes
+        self.scopes = scope.split() if scope else []
         self.client_id = client_id
         self.client_secret = client_secret
 
@@ -182,6 +183,8 @@ class OAuth2PasswordRequestFormStrict(OAuth2PasswordRequestForm):
 
 
 class OAuth2(SecurityBaseResolver):
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -207,6 +210,8 @@ class OAuth2(SecurityBaseResolver):
 
 
 class OAuth2PasswordBearer(OAuth2):
+    __slots__ = ()
+
     def __init__(
         self,
         tokenUrl: str,
@@ -227,6 +232,10 @@ class OAuth2PasswordBearer(OAuth2):
 
     async def __call__(self, request: Request) -> Optional[str]:
         authorization = request.headers.get("Authorization")
+        matched = match_authorization_scheme(authorization, "bearer")
+        if matched is not None:
+            return matched[1]
+
         scheme, param = get_authorization_scheme_param(authorization)
         if not authorization or scheme.lower() != "bearer":
             if self.auto_error:
@@ -241,6 +250,8 @@ class OAuth2PasswordBearer(OAuth2):
 
 
 class OAuth2AuthorizationCodeBearer(OAuth2):
+    __slots__ = ()
+
     def __init__(
         self,
         authorizationUrl: str,
@@ -270,6 +281,10 @@ class OAuth2AuthorizationCodeBearer(OAuth2):
 
     async def __call__(self, request: Request) -> Optional[str]:
         authorization = request.headers.get("Authorization")
+        matched = match_authorization_scheme(authorization, "bearer")
+        if matched is not None:
+            return matched[1]
+
         scheme, param = get_authorization_scheme_param(authorization)
         if not authorization or scheme.lower() != "bearer":
             if self.auto_error:
@@ -284,6 +299,15 @@ class OAuth2AuthorizationCodeBearer(OAuth2):
 
 
 class SecurityScopes:
+    __slots__ = ('scopes', '_scope_str')
+
     def __init__(self, scopes: Optional[List[str]] = None):
         self.scopes = scopes or []
-        self.scope_str = " ".join(self.scopes)
+        self._scope_str: Optional[str] = None
+
+    @property
+    def scope_str(self) -> str:
+        # Joined on first access, most users only iterate the scopes.
+        if self._scope_str is None:
+            self._scope_str = " ".join(self.scopes)
+        return self._scope_str
@@ -16,6 +16,8 @@ class OpenIdConnectModel(SecurityBase):
 
 
 class OpenIdConnect(SecurityBaseResolver):
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
@@ -8,3 +9,25 @@ def get_authorization_scheme_param(
         return "", ""
     scheme, _, param = authorization_header_value.partition(" ")
     return scheme, param
+
+
+@lru_cache(maxsize=None)
+def _scheme_prefixes(scheme: str) -> Tuple[str, ...]:
+    '''
+        The spellings of the scheme that skip lower casing, e.g.: ("Bearer ", "bearer ") for "bearer".
+    '''
+    return (f"{scheme.capitalize()} ", f"{scheme.lower()} ")
+
+
+def match_authorization_scheme(
+    authorization_header_value: Optional[str],
+    scheme: str,
+) -> Optional[Tuple[str, str]]:
+    '''
+        Fast path for headers using the common spellings of the scheme, e.g.: "Bearer" or "bearer".
+        Returns the scheme and param without lower casing the scheme, or None if the header doesn't
+        use one of those spellings. Callers fall back to get_authorization_scheme_param.
+    '''
+    if authorization_header_value and authorization_header_value.startswith(_scheme_prefixes(scheme)):
+        return authorization_header_value[:len(scheme)], authorization_header_value[len(scheme) + 1:]
+    return None
@@ -288,6 +288,13 @@ def dict_safe_add(d: Dict, path: str, value: Any):
     dpath.new(d, path, value, separator='.', creator=__dict_creator__)
 
 
+def ensure_dict_path(d: Dict, *keys: Any) -> Dict:
+    '''Walks the keys, creating empty dicts where missing, and returns the last one.'''
+    for key in keys:
+        d = d.setdefault(key, {})
+    return d
+
+
 def deep_dict_update(main_dict: Dict[Any, Any], update_dict: Dict[Any, Any]) -> None:
     for key, value in update_dict.items():
         if (
@@ -1,3 +1,4 @@
+import pytest
 from starlette.testclient import TestClient
 
 from starmallow import StarMallow
@@ -41,3 +42,13 @@ def test_openapi_schema():
     assert response.json() == {
         "detail": "Failed to generate schema",
     }
+
+
+def test_unknown_response_model_fails_at_registration():
+    class NotAModel:
+        pass
+
+    with pytest.raises(Exception, match="Unknown model type"):
+        @app.get("/b", responses={404: {"model": NotAModel}})
+        async def b():
+            pass  # pragma: no cover
@@ -0,0 +1,103 @@
+import pytest
+from marshmallow_dataclass import dataclass
+from starlette.routing import Mount
+
+from starmallow import APIRouter, Body, Header, Query, ResolvedParam, StarMallow
+from starmallow.schema_generator import SchemaGenerator
+
+app = StarMallow()
+
+router = APIRouter()
+
+
+@router.get("/items/{item_id}")
+def get_item(item_id: int, q: str = None) -> int:
+    return item_id  # pragma: no cover
+
+
+def get_version(version: str = Header(None)):
+    return version  # pragma: no cover
+
+
+@router.get("/versions")
+def get_versions(version: str = Query(None), header_version=ResolvedParam(get_version)) -> str:
+    return version  # pragma: no cover
+
+
+app.include_router(router)
+
+
+def get_generator():
+    return SchemaGenerator(app.title, app.version, app.description, app.openapi_version)
+
+
+def test_same_parameter_name_in_different_locations():
+    schema = get_generator().get_schema(app.routes)
+
+    parameters = schema["paths"]["/versions"]["get"]["parameters"]
+    assert sorted((p["name"], p["in"]) for p in parameters) == [("version", "header"), ("version", "query")]
+
+
+def test_multiple_methods_with_body():
+    multi_method_app = StarMallow()
+
+    @multi_method_app.api_route("/things/{thing_id}", methods=["PUT", "PATCH"])
+    def update_thing(thing_id: int, name: str = Body(), size: int = Body()) -> int:
+        return thing_id  # pragma: no cover
+
+    # Both methods share the route's operationId
+    with pytest.warns(UserWarning, match="Duplicate Operation ID"):
+        schema = multi_method_app.openapi()
+
+    operations = schema["paths"]["/things/{thing_id}"]
+    assert sorted(operations) == ["patch", "put"]
+    assert operations["put"]["requestBody"] == operations["patch"]["requestBody"]
+
+
+def test_mounted_routes_sharing_a_path():
+    top_router = APIRouter()
+    mount_router = APIRouter()
+
+    @top_router.get("/api/items")
+    def list_items() -> list[str]:
+        return []  # pragma: no cover
+
+    @mount_router.post("/items")
+    def create_item(name: str = Body()) -> str:
+        return name  # pragma: no cover
+
+    mounted_app = StarMallow(routes=[*top_router.routes, Mount("/api", routes=mount_router.routes)])
+
+    schema = mounted_app.openapi()
+
+    assert sorted(schema["paths"]["/api/items"]) == ["get", "post"]
+
+
+def test_duplicate_operation_id_across_mounts():
+    leaf_router = APIRouter()
+
+    @leaf_router.get("/leaf/{z}")
+    def leaf(z: int) -> int:
+        return z  # pragma: no cover
+
+    mounted_app = StarMallow(routes=[Mount("/a", routes=leaf_router.routes), Mount("/b", routes=leaf_router.routes)])
+
+    with pytest.warns(UserWarning, match="Duplicate Operation ID .*leaf__z__get"):
+        mounted_app.openapi()
+
+
+@dataclass
+class Secret:
+    value: str
+
+
+def test_body_excluded_from_schema():
+    hidden_body_app = StarMallow()
+
+    @hidden_body_app.post("/secrets")
+    def create_secret(secret: Secret = Body(include_in_schema=False)) -> None:
+        pass  # pragma: no cover
+
+    schema = hidden_body_app.openapi()
+
+    assert "requestBody" not in schema["paths"]["/secrets"]["post"]